@@ -1,10 +1,20 @@
+import argparse
+import atexit
 import boto3
-from botocore.exceptions import ClientError
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, WaiterError
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
+import mimetypes
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from datetime import datetime
 import os
-import time
+import queue
+import threading
+import uuid
 
 # This script is used to deploy an SPA application that consists of:    
 # Frontend: React deployed to S3 accessed via Route53/CloudFront
@@ -15,8 +25,9 @@ import time
 #1. Before running script:
 #  create eb app and env and then eb deploy
 #  update the orchestration variables below
-#2. Run deploy_app()
-#3. After running script, npm run build and copy files to S3 bucket
+#2. Run deploy_app() (python main.py)
+#   or only the EB HTTPS step (python main.py --eb-only CERT_ARN)
+#3. After running script, npm run build and upload it with upload_react_build(bucket, build_path)
 
 
 # Constants
@@ -32,39 +43,133 @@ EB_ENV_NAME = "ra-env"
 frontend_domain = f"{FRONTEND_SUBDOMAIN}.{DOMAIN_NAME}"
 backend_domain = f"{BACKEND_SUBDOMAIN}.{DOMAIN_NAME}"
 
-# Create logs directory if it doesn't exist
-if not os.path.exists('logs'):
-    os.makedirs('logs')
-
-# Generate log filename with timestamp
-log_filename = f"logs/deployment_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-# Configure logging to both file and console
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.FileHandler(log_filename),
-        logging.StreamHandler()
+# Bucket policy for public read access, serialized once - only the bucket name varies
+_POLICY_TEMPLATE = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Sid": "PublicReadGetObject",
+            "Effect": "Allow",
+            "Principal": "*",
+            "Action": ["s3:GetObject"],
+            "Resource": ["arn:aws:s3:::{BUCKET}/*"]
+        }
     ]
-)
+}, separators=(',', ':'))
+
+# Public access block settings - all off so the public read policy can apply
+_PUBLIC_ACCESS_BLOCK_CONFIGURATION = {
+    'BlockPublicAcls': False,
+    'IgnorePublicAcls': False,
+    'BlockPublicPolicy': False,
+    'RestrictPublicBuckets': False
+}
+
+# Static website hosting configuration for the frontend bucket
+_WEBSITE_CONFIGURATION = {
+    'ErrorDocument': {'Key': 'index.html'},
+    'IndexDocument': {'Suffix': 'index.html'}
+}
+
 logger = logging.getLogger(__name__)
 
-# Log the start of the script with some basic info
-logger.info("=" * 80)
-logger.info("Starting AWS Deployment Script")
-logger.info(f"Log file: {log_filename}")
-logger.info(f"AWS Region: {AWS_REGION}")
-logger.info(f"Domain: {DOMAIN_NAME}")
-logger.info(f"Frontend Domain: {frontend_domain}")
-logger.info(f"Backend Domain: {backend_domain}")
-logger.info("=" * 80)
+# Elastic Beanstalk environment CNAMEs by environment name
+_eb_cname_cache = {}
+
+# Serializes Session.client() in get_client - the deployment worker threads
+# may ask for clients concurrently
+_session_lock = threading.Lock()
 
+# Pool sized above the worker count so concurrent calls reuse warm connections;
+# adaptive retries rate-limit client-side when parallel steps hit throttling,
+# and short timeouts hand a stalled connection back to the retry logic quickly
+client_config = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=5,
+    read_timeout=30
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_session():
+    """
+    Gets the shared session, creating it on first use so importing this module stays cheap
+    
+    Returns:
+        boto3.session.Session: Session for AWS_REGION
+    """
+    return boto3.session.Session(region_name=AWS_REGION)
+
+@functools.lru_cache(maxsize=None)
+def get_client(service_name):
+    """
+    Gets the shared client for an AWS service, creating it on first use
+    
+    Args:
+        service_name (str): AWS service name (e.g., 's3')
+        
+    Returns:
+        botocore.client.BaseClient: Client bound to the shared session and config
+    """
+    # Session.client() itself is not thread-safe
+    with _session_lock:
+        return get_session().client(service_name, config=client_config)
+
+def _configure_logging():
+    """
+    Configures logging to both a timestamped log file and the console
+    """
+    # Create logs directory if it doesn't exist
+    os.makedirs('logs', exist_ok=True)
+
+    # Generate log filename with timestamp
+    log_filename = f"logs/deployment_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+
+    # Configure logging to both file and console
+    formatter = logging.Formatter(
+        fmt='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    file_handler = logging.FileHandler(log_filename)
+    file_handler.setFormatter(formatter)
+    # Batch file writes in small groups - warnings and errors flush immediately
+    buffered_file_handler = MemoryHandler(
+        capacity=16,
+        flushLevel=logging.WARNING,
+        target=file_handler
+    )
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    # Callers only enqueue records - a background listener does the file/console writes
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler]
+    )
+
+    listener = QueueListener(log_queue, buffered_file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Log the start of the script with some basic info
+    logger.info("=" * 80)
+    logger.info("Starting AWS Deployment Script")
+    logger.info("Log file: %s", log_filename)
+    logger.info("AWS Region: %s", AWS_REGION)
+    logger.info("Domain: %s", DOMAIN_NAME)
+    logger.info("Frontend Domain: %s", frontend_domain)
+    logger.info("Backend Domain: %s", backend_domain)
+    logger.info("=" * 80)
 
 def create_s3_bucket(domain_name):
     """
     Creates and configures an S3 bucket for static website hosting.
+    An existing bucket owned by you is reconfigured where its settings have drifted.
     
     Args:
         domain_name (str): The domain name to use as the bucket name
@@ -72,85 +177,24 @@ def create_s3_bucket(domain_name):
     Returns:
         dict: Contains status and website_url if successful, or error message if failed
     """
-    logger.info(f"Starting S3 bucket creation for domain: {domain_name}")
+    logger.info("Starting S3 bucket creation for domain: %s", domain_name)
     try:
-        # Initialize S3 client
-        s3_client = boto3.client('s3')
-        logger.info(f"Creating bucket '{domain_name}' in region {s3_client.meta.region_name}")
+        s3_client = get_client('s3')
         
         # Step 1: Create the bucket with public access
-        # Special handling for us-east-1 region
-        if s3_client.meta.region_name == 'us-east-1':
-            logger.info("Using special configuration for us-east-1 region")
-            s3_client.create_bucket(
-                Bucket=domain_name,
-                ObjectOwnership='ObjectWriter'  # Required for public access
-            )
-        else:
-            s3_client.create_bucket(
-                Bucket=domain_name,
-                CreateBucketConfiguration={
-                    'LocationConstraint': s3_client.meta.region_name
-                },
-                ObjectOwnership='ObjectWriter'  # Required for public access
-            )
-        logger.info(f"Successfully created bucket: {domain_name}")
-        
-        # Disable block public access
-        logger.info("Configuring public access settings")
-        s3_client.put_public_access_block(
-            Bucket=domain_name,
-            PublicAccessBlockConfiguration={
-                'BlockPublicAcls': False,
-                'IgnorePublicAcls': False,
-                'BlockPublicPolicy': False,
-                'RestrictPublicBuckets': False
-            }
-        )
-        logger.info("Public access block settings updated")
-        
-        # Step 2: Set bucket policy for public read access
-        logger.info("Setting bucket policy for public read access")
-        bucket_policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "PublicReadGetObject",
-                    "Effect": "Allow",
-                    "Principal": "*",
-                    "Action": ["s3:GetObject"],
-                    "Resource": [f"arn:aws:s3:::{domain_name}/*"]
-                }
-            ]
-        }
-        
-        # Convert policy to JSON string and apply it
-        s3_client.put_bucket_policy(
-            Bucket=domain_name,
-            Policy=json.dumps(bucket_policy)
-        )
-        logger.info("Bucket policy applied successfully")
+        bucket_created = _ensure_bucket(domain_name)
         
-        # Step 3: Enable static website hosting
-        logger.info("Configuring static website hosting")
-        website_configuration = {
-            'ErrorDocument': {'Key': 'index.html'},
-            'IndexDocument': {'Suffix': 'index.html'}
-        }
-        
-        s3_client.put_bucket_website(
-            Bucket=domain_name,
-            WebsiteConfiguration=website_configuration
-        )
-        logger.info("Static website hosting configured")
+        # Steps 2 and 3: Public read access and static website hosting
+        _ensure_bucket_config(domain_name, check_existing=not bucket_created)
         
         # Get the website URL
         website_url = f"http://{domain_name}.s3-website-{s3_client.meta.region_name}.amazonaws.com"
-        logger.info(f"Website URL: {website_url}")
+        logger.info("Website URL: %s", website_url)
         
         return {
             'status': 'success',
-            'message': 'Bucket created and configured successfully',
+            'message': 'Bucket created and configured successfully' if bucket_created
+                else 'Existing bucket configured successfully',
             'website_url': website_url
         }
         
@@ -159,46 +203,335 @@ def create_s3_bucket(domain_name):
         error_message = e.response['Error']['Message']
         
         # Handle specific error cases
-        if error_code == 'BucketAlreadyOwnedByYou':
-            logger.warning(f"Bucket {domain_name} already exists and is owned by you")
-            return {
-                'status': 'error',
-                'message': f'Bucket {domain_name} already exists and is owned by you'
-            }
-        elif error_code == 'BucketAlreadyExists':
-            logger.error(f"Bucket {domain_name} already exists and is owned by another AWS account")
+        if error_code == 'BucketAlreadyExists':
+            logger.error("Bucket %s already exists and is owned by another AWS account", domain_name)
             return {
                 'status': 'error',
                 'message': f'Bucket {domain_name} already exists and is owned by another AWS account'
             }
         else:
-            logger.error(f"Error creating bucket: {error_message}")
+            logger.error("Error creating bucket: %s", error_message)
             return {
                 'status': 'error',
                 'message': f'Error creating bucket: {error_message}'
             }
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return {
             'status': 'error',
             'message': f'Unexpected error: {str(e)}'
         }
 
+def _ensure_bucket(bucket_name):
+    """
+    Creates the S3 bucket unless it already exists and is owned by you
+    
+    Args:
+        bucket_name (str): Name of the S3 bucket
+        
+    Returns:
+        bool: True if the bucket was created, False if it already existed
+    """
+    s3_client = get_client('s3')
+    
+    # Check for an existing bucket first - a HEAD is cheaper than a rejected create
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
+        logger.info("Bucket %s already exists and is owned by you", bucket_name)
+        return False
+    except ClientError as e:
+        # A 403 is either a foreign bucket or missing s3:ListBucket on your own -
+        # let create_bucket tell them apart (BucketAlreadyExists vs ...OwnedByYou)
+        if e.response['Error']['Code'] not in ('404', '403'):
+            raise
+    
+    logger.info("Creating bucket '%s' in region %s", bucket_name, s3_client.meta.region_name)
+    try:
+        # Special handling for us-east-1 region
+        if s3_client.meta.region_name == 'us-east-1':
+            logger.info("Using special configuration for us-east-1 region")
+            s3_client.create_bucket(
+                Bucket=bucket_name,
+                ObjectOwnership='ObjectWriter'  # Required for public access
+            )
+        else:
+            s3_client.create_bucket(
+                Bucket=bucket_name,
+                CreateBucketConfiguration={
+                    'LocationConstraint': s3_client.meta.region_name
+                },
+                ObjectOwnership='ObjectWriter'  # Required for public access
+            )
+    except ClientError as e:
+        # Created between the HEAD and the create (e.g., by a parallel run)
+        if e.response['Error']['Code'] == 'BucketAlreadyOwnedByYou':
+            logger.info("Bucket %s already exists and is owned by you", bucket_name)
+            return False
+        raise
+    
+    logger.info("Successfully created bucket: %s", bucket_name)
+    return True
+
+def _ensure_bucket_config(bucket_name, check_existing):
+    """
+    Applies the public access, bucket policy and website settings to an S3 bucket
+    
+    Args:
+        bucket_name (str): Name of the S3 bucket
+        check_existing (bool): Read the current settings first and only write those that differ
+    """
+    s3_client = get_client('s3')
+    policy = _POLICY_TEMPLATE.replace('{BUCKET}', bucket_name)
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        if check_existing:
+            # Three reads are cheaper than three writes, and a clean re-run needs no writes
+            access_future = executor.submit(
+                _get_bucket_setting, s3_client.get_public_access_block, bucket_name,
+                'NoSuchPublicAccessBlockConfiguration'
+            )
+            policy_future = executor.submit(
+                _get_bucket_setting, s3_client.get_bucket_policy, bucket_name, 'NoSuchBucketPolicy'
+            )
+            website_future = executor.submit(
+                _get_bucket_setting, s3_client.get_bucket_website, bucket_name, 'NoSuchWebsiteConfiguration'
+            )
+            
+            current_access = access_future.result()
+            access_ok = (
+                current_access is not None
+                and current_access['PublicAccessBlockConfiguration'] == _PUBLIC_ACCESS_BLOCK_CONFIGURATION
+            )
+            current_policy = policy_future.result()
+            policy_ok = (
+                current_policy is not None
+                and _normalize_policy(json.loads(current_policy['Policy'])) == _normalize_policy(json.loads(policy))
+            )
+            current_website = website_future.result()
+            website_ok = (
+                current_website is not None
+                and {k: v for k, v in current_website.items() if k != 'ResponseMetadata'} == _WEBSITE_CONFIGURATION
+            )
+        else:
+            access_ok = policy_ok = website_ok = False
+        
+        # Website hosting is independent of the access settings, so apply it concurrently
+        if website_ok:
+            logger.info("Static website hosting already configured")
+            website_future = None
+        else:
+            website_future = executor.submit(configure_s3_website, bucket_name)
+        
+        # Disable block public access
+        if access_ok:
+            logger.info("Public access block settings already up to date")
+        else:
+            logger.info("Configuring public access settings")
+            s3_client.put_public_access_block(
+                Bucket=bucket_name,
+                PublicAccessBlockConfiguration=_PUBLIC_ACCESS_BLOCK_CONFIGURATION
+            )
+            logger.info("Public access block settings updated")
+        
+        # Set bucket policy for public read access
+        # (must follow the public access block update or it is rejected)
+        if policy_ok:
+            logger.info("Bucket policy already up to date")
+        else:
+            logger.info("Setting bucket policy for public read access")
+            s3_client.put_bucket_policy(
+                Bucket=bucket_name,
+                Policy=policy
+            )
+            logger.info("Bucket policy applied successfully")
+        
+        if website_future:
+            website_future.result()
+
+def _get_bucket_setting(get_method, bucket_name, missing_error_code):
+    """
+    Gets one bucket setting via an S3 get_* call
+    
+    Args:
+        get_method (callable): S3 client method (e.g., s3_client.get_bucket_policy)
+        bucket_name (str): Name of the S3 bucket
+        missing_error_code (str): Error code S3 returns when the setting is not configured
+        
+    Returns:
+        dict: The get_* response, None if the setting is not configured
+    """
+    try:
+        return get_method(Bucket=bucket_name)
+    except ClientError as e:
+        if e.response['Error']['Code'] == missing_error_code:
+            return None
+        raise
+
+def _normalize_policy(value):
+    """
+    Normalizes a bucket policy so equivalent policies compare equal
+    
+    Args:
+        value: Parsed policy document, or any value nested within it
+        
+    Returns:
+        The value with single-item lists collapsed to the item itself,
+        since S3 may hand back single-item lists in a stored policy as plain values
+    """
+    if isinstance(value, dict):
+        return {key: _normalize_policy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        items = [_normalize_policy(item) for item in value]
+        return items[0] if len(items) == 1 else items
+    return value
+
+def configure_s3_website(bucket_name):
+    """
+    Enables static website hosting on an S3 bucket
+    
+    Args:
+        bucket_name (str): Name of the S3 bucket
+    """
+    s3_client = get_client('s3')
+    
+    # Enable static website hosting
+    logger.info("Configuring static website hosting")
+    s3_client.put_bucket_website(
+        Bucket=bucket_name,
+        WebsiteConfiguration=_WEBSITE_CONFIGURATION
+    )
+    logger.info("Static website hosting configured")
+
+def _build_file_upload_args(local_path, build_path):
+    """
+    Gets the S3 key and upload headers for a file in the React build
+    
+    Args:
+        local_path (str): Path of the file to upload
+        build_path (str): Local path of the npm run build output
+        
+    Returns:
+        tuple: S3 key and the extra args (ContentType, CacheControl) for the upload
+    """
+    key = os.path.relpath(local_path, build_path).replace(os.sep, '/')
+    content_type = mimetypes.guess_type(local_path)[0] or 'application/octet-stream'
+    
+    # Hashed assets under static/ never change - everything else (index.html etc.) must revalidate
+    cache_control = 'public,max-age=31536000' if key.startswith('static/') else 'no-cache'
+    
+    return key, {
+        'ContentType': content_type,
+        'CacheControl': cache_control
+    }
+
+def upload_react_build(bucket_name, build_path):
+    """
+    Uploads a React build folder to the S3 bucket, many files at a time
+    
+    Args:
+        bucket_name (str): Name of the S3 bucket (e.g., ra.ironcliff.ai)
+        build_path (str): Local path of the npm run build output
+        
+    Returns:
+        dict: Contains status and uploaded file count if successful, or error message if failed
+    """
+    logger.info("Uploading React build from %s to bucket %s", build_path, bucket_name)
+    
+    if not os.path.isdir(build_path):
+        logger.error("React build folder %s not found", build_path)
+        return {
+            'status': 'error',
+            'message': f'React build folder {build_path} not found'
+        }
+    
+    s3_client = get_client('s3')
+    transfer_config = TransferConfig(
+        max_concurrency=20,
+        multipart_threshold=8 * 1024 * 1024,
+        use_threads=True
+    )
+    
+    local_paths = [
+        os.path.join(root, file_name)
+        for root, _, file_names in os.walk(build_path)
+        for file_name in file_names
+    ]
+    
+    try:
+        # One transfer manager (and one worker pool) for every file in the build
+        with create_transfer_manager(s3_client, transfer_config) as transfer_manager:
+            uploads = []
+            for local_path in local_paths:
+                key, extra_args = _build_file_upload_args(local_path, build_path)
+                uploads.append((key, transfer_manager.upload(local_path, bucket_name, key, extra_args=extra_args)))
+            
+            for key, future in uploads:
+                future.result()
+                logger.info("Uploaded %s", key)
+        
+        logger.info("Uploaded %s files to bucket %s", len(local_paths), bucket_name)
+        return {
+            'status': 'success',
+            'message': 'React build uploaded successfully',
+            'file_count': len(local_paths)
+        }
+        
+    except (ClientError, BotoCoreError, OSError) as e:
+        logger.error("Error uploading React build: %s", e)
+        return {
+            'status': 'error',
+            'message': f'Error uploading React build: {str(e)}'
+        }
+
+def find_acm_certificate(frontend_domain, backend_domain):
+    """
+    Finds an issued or pending ACM certificate for the domain and alternative name
+    
+    Args:
+        frontend_domain (str): Certificate domain name (e.g., 'ra.ironcliff.ai')
+        backend_domain (str): Alternative name (e.g., 'ra-api.ironcliff.ai')
+        
+    Returns:
+        str: Certificate ARN if found (issued preferred over pending validation), None otherwise
+    """
+    acm_client = get_client('acm')
+    paginator = acm_client.get_paginator('list_certificates')
+    pending_certificate_arn = None
+    
+    for page in paginator.paginate(CertificateStatuses=['ISSUED', 'PENDING_VALIDATION']):
+        for certificate in page['CertificateSummaryList']:
+            alternative_names = certificate.get('SubjectAlternativeNameSummaries', [])
+            if certificate['DomainName'] != frontend_domain or backend_domain not in alternative_names:
+                continue
+            if certificate.get('Status') == 'ISSUED':
+                return certificate['CertificateArn']
+            if not pending_certificate_arn:
+                pending_certificate_arn = certificate['CertificateArn']
+    
+    return pending_certificate_arn
+
 def create_acm_certificate(frontend_domain, backend_domain):
     """
-    Creates and validates an ACM certificate for the domain and alternative names
+    Requests an ACM certificate for the domain and alternative name.
+    An existing issued or pending certificate from a previous run is reused instead.
     
     Args:
-        domain_name (str): Main domain name (e.g., 'ironcliff.ai')
-        alternative_names (list): List of full domain names (e.g., ['ra.ironcliff.ai', 'ra-api.ironcliff.ai'])
+        frontend_domain (str): Certificate domain name (e.g., 'ra.ironcliff.ai')
+        backend_domain (str): Alternative name (e.g., 'ra-api.ironcliff.ai')
         
     Returns:
-        str: Certificate ARN if successful, None if failed
+        str: ARN of the reused or requested certificate if successful, None if failed
     """
-    logger.info(f"Creating ACM certificate for {frontend_domain} and alternative names {backend_domain}")
+    logger.info("Creating ACM certificate for %s and alternative names %s", frontend_domain, backend_domain)
     
     try:
-        acm_client = boto3.client('acm', region_name=AWS_REGION)
+        acm_client = get_client('acm')
+        
+        # Reuse a certificate from a previous run (the validation waiter handles pending ones)
+        certificate_arn = find_acm_certificate(frontend_domain, backend_domain)
+        if certificate_arn:
+            logger.info("Using existing certificate. ARN: %s", certificate_arn)
+            return certificate_arn
         
         # Request certificate
         response = acm_client.request_certificate(
@@ -208,12 +541,89 @@ def create_acm_certificate(frontend_domain, backend_domain):
         )
         
         certificate_arn = response['CertificateArn']
-        logger.info(f"Certificate requested successfully. ARN: {certificate_arn}")
+        logger.info("Certificate requested successfully. ARN: %s", certificate_arn)
         
         return certificate_arn
         
     except ClientError as e:
-        logger.error(f"Error requesting certificate: {str(e)}")
+        logger.error("Error requesting certificate: %s", e)
+        return None
+
+def wait_for_acm_certificate_validated(certificate_arn):
+    """
+    Waits for an ACM certificate to be validated and issued
+    
+    Args:
+        certificate_arn (str): ACM certificate ARN
+        
+    Returns:
+        bool: True if the certificate is issued, False if failed or timed out
+    """
+    logger.info("Waiting for certificate %s to be validated...", certificate_arn)
+    try:
+        acm_client = get_client('acm')
+        
+        acm_client.get_waiter('certificate_validated').wait(
+            CertificateArn=certificate_arn,
+            WaiterConfig={'Delay': 10, 'MaxAttempts': 60}
+        )
+        logger.info("Certificate %s is issued", certificate_arn)
+        return True
+        
+    except WaiterError as e:
+        logger.error("Error waiting for certificate validation: %s", e)
+        log_acm_validation_records(certificate_arn)
+        return False
+
+def log_acm_validation_records(certificate_arn):
+    """
+    Logs the DNS records that must exist for ACM to validate a certificate
+    
+    Args:
+        certificate_arn (str): ACM certificate ARN
+    """
+    try:
+        acm_client = get_client('acm')
+        
+        certificate = acm_client.describe_certificate(CertificateArn=certificate_arn)['Certificate']
+        for option in certificate.get('DomainValidationOptions', []):
+            record = option.get('ResourceRecord')
+            if record:
+                logger.error(
+                    "Add DNS record to validate %s (status %s): %s %s %s",
+                    option['DomainName'],
+                    option.get('ValidationStatus'),
+                    record['Name'],
+                    record['Type'],
+                    record['Value']
+                )
+        
+    except ClientError as e:
+        logger.error("Error getting certificate validation records: %s", e)
+
+def find_cloudfront_distribution(domain_name):
+    """
+    Finds an existing CloudFront distribution serving the domain name
+    
+    Args:
+        domain_name (str): Domain name (alias) of the distribution
+        
+    Returns:
+        dict: Distribution summary if found, None otherwise
+    """
+    try:
+        cloudfront_client = get_client('cloudfront')
+        paginator = cloudfront_client.get_paginator('list_distributions')
+        
+        for page in paginator.paginate():
+            for distribution in page['DistributionList'].get('Items', []):
+                if domain_name in distribution['Aliases'].get('Items', []):
+                    return distribution
+        
+        return None
+        
+    except ClientError as e:
+        logger.error("Error listing CloudFront distributions: %s", e)
         return None
 
 def create_cloudfront_distribution(
@@ -221,27 +631,34 @@ def create_cloudfront_distribution(
         certificate_arn
     ):
     """
-    Creates a CloudFront distribution for the S3 bucket
+    Creates a CloudFront distribution for the S3 bucket.
+    An existing distribution already serving the domain name is reused instead.
     
     Args:
         domain_name (str): Domain name for the distribution
-        s3_bucket_website_endpoint (str): S3 bucket website endpoint (e.g., bucket-name.s3-website-region.amazonaws.com)
         certificate_arn (str): ACM certificate ARN
         
     Returns:
-        dict: Distribution details if successful, None if failed
+        dict: Summary of the existing distribution, or details of the created one;
+            None if failed
     """
-    logger.info(f"Creating CloudFront distribution for {domain_name}")
+    logger.info("Creating CloudFront distribution for %s", domain_name)
+
+    # A distribution can only be created once per alias - reuse it on re-runs
+    existing_distribution = find_cloudfront_distribution(domain_name)
+    if existing_distribution:
+        logger.info("Using existing CloudFront distribution %s", existing_distribution['Id'])
+        return existing_distribution
 
     # Get S3 website endpoint for existing bucket
     s3_website_endpoint = get_s3_website_endpoint(frontend_domain)
-    logger.info(f"Using S3 website endpoint: {s3_website_endpoint}")
+    logger.info("Using S3 website endpoint: %s", s3_website_endpoint)
 
     try:
-        cloudfront_client = boto3.client('cloudfront')
+        cloudfront_client = get_client('cloudfront')
         
         distribution_config = {
-            'CallerReference': str(datetime.now().timestamp()),
+            'CallerReference': uuid.uuid4().hex,
             'Comment': f'Distribution for {domain_name}',
             'Aliases': {
                 'Quantity': 1,
@@ -288,94 +705,157 @@ def create_cloudfront_distribution(
             DistributionConfig=distribution_config
         )
         
-        logger.info(f"CloudFront distribution created successfully")
+        logger.info("CloudFront distribution created successfully")
         return response['Distribution']
         
     except ClientError as e:
-        logger.error(f"Error creating CloudFront distribution: {str(e)}")
+        logger.error("Error creating CloudFront distribution: %s", e)
         return None
 
-def get_s3_website_endpoint(bucket_name, region=AWS_REGION):
+def wait_for_cloudfront_distribution_deployed(distribution_id):
+    """
+    Waits for a CloudFront distribution to finish deploying
+    
+    Args:
+        distribution_id (str): ID of the CloudFront distribution
+        
+    Returns:
+        dict: Deployed distribution details if successful, None if failed or timed out
+    """
+    logger.info("Waiting for CloudFront distribution %s to be deployed...", distribution_id)
+    try:
+        cloudfront_client = get_client('cloudfront')
+        
+        cloudfront_client.get_waiter('distribution_deployed').wait(
+            Id=distribution_id,
+            WaiterConfig={'Delay': 60, 'MaxAttempts': 40}
+        )
+        distribution = cloudfront_client.get_distribution(Id=distribution_id)['Distribution']
+        logger.info("CloudFront distribution %s is deployed", distribution_id)
+        return distribution
+        
+    except WaiterError as e:
+        logger.error("Error waiting for CloudFront distribution: %s", e)
+        return None
+    except ClientError as e:
+        logger.error("Error getting CloudFront distribution: %s", e)
+        return None
+
+def get_s3_website_endpoint(bucket_name, region=AWS_REGION, verify=False):
     """
     Gets the S3 website endpoint for an existing bucket
     
     Args:
         bucket_name (str): Name of the S3 bucket (e.g., ra.ironcliff.ai)
         region (str): AWS region
+        verify (bool): Confirm the bucket has website hosting enabled first (one extra S3 call)
         
     Returns:
-        str: Website endpoint URL
+        str: Website endpoint URL, None if verification failed
     """
-    try:
-        s3_client = boto3.client('s3')
+    if verify:
+        s3_client = get_client('s3')
         
-        # Try to get the website configuration to confirm bucket exists and has website enabled
+        # Get the website configuration to confirm bucket exists and has website enabled
         try:
             s3_client.get_bucket_website(Bucket=bucket_name)
-            logger.info(f"Found website configuration for bucket {bucket_name}")
+            logger.info("Found website configuration for bucket %s", bucket_name)
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchWebsiteConfiguration':
-                logger.error(f"Bucket {bucket_name} does not have website hosting enabled")
+                logger.error("Bucket %s does not have website hosting enabled", bucket_name)
             else:
-                logger.error(f"Error checking bucket website config: {str(e)}")
+                logger.error("Error checking bucket website config: %s", e)
             return None
 
-        # Return the bucket website endpoint
-        return f"{bucket_name}.s3-website-{region}.amazonaws.com"
-        
-    except ClientError as e:
-        logger.error(f"Error getting S3 website endpoint: {str(e)}")
-        return None
+    # The endpoint is a fixed format - no lookup needed
+    return f"{bucket_name}.s3-website-{region}.amazonaws.com"
 
-def create_frontend_route53_record(domain_name, cloudfront_domain_name):
+def get_frontend_route53_change(domain_name, cloudfront_domain_name):
     """
-    Creates Route53 A record pointing to CloudFront distribution
+    Builds the Route53 change for an A record pointing to CloudFront distribution
     
     Args:
         domain_name (str): Domain name for the record (e.g., ra.ironcliff.ai)
         cloudfront_domain_name (str): CloudFront distribution domain name
+        
+    Returns:
+        dict: Route53 UPSERT change
+    """
+    return {
+        'Action': 'UPSERT',
+        'ResourceRecordSet': {
+            'Name': domain_name,
+            'Type': 'A',
+            'AliasTarget': {
+                'HostedZoneId': 'Z2FDTNDATAQYW2',  # CloudFront's hosted zone ID (constant)
+                'DNSName': cloudfront_domain_name,
+                'EvaluateTargetHealth': False
+            }
+        }
+    }
+
+@functools.lru_cache(maxsize=32)
+def get_hosted_zone_id(base_domain):
+    """
+    Gets the Route53 hosted zone ID for a base domain, looked up once per domain
+    
+    Args:
+        base_domain (str): Base domain of the hosted zone (e.g., ironcliff.ai)
+        
+    Returns:
+        str: Hosted zone ID if found, None otherwise
+    """
+    route53_client = get_client('route53')
+    
+    # Zones are returned in name order starting at DNSName, so the first one is
+    # the match if it exists - no paging through every zone in the account
+    hosted_zones = route53_client.list_hosted_zones_by_name(
+        DNSName=base_domain,
+        MaxItems='1'
+    )
+    
+    for zone in hosted_zones['HostedZones']:
+        if zone['Name'].rstrip('.') == base_domain:
+            return zone['Id']
+    
+    return None
+
+def create_route53_records(changes):
+    """
+    Creates/updates Route53 records in a single change batch
+    
+    Args:
+        changes (list): Route53 changes, all for records under the same base domain
+        
+    Returns:
+        dict: change_resource_record_sets response if successful, None if failed
     """
     try:
-        route53_client = boto3.client('route53')
+        route53_client = get_client('route53')
         
         # Get the hosted zone ID for the domain
-        hosted_zones = route53_client.list_hosted_zones()
-        zone_id = None
+        domain_name = changes[0]['ResourceRecordSet']['Name']
         base_domain = '.'.join(domain_name.split('.')[-2:])  # Get base domain (e.g., ironcliff.ai)
-        
-        for zone in hosted_zones['HostedZones']:
-            if zone['Name'].rstrip('.') == base_domain:
-                zone_id = zone['Id']
-                break
+        zone_id = get_hosted_zone_id(base_domain)
         
         if not zone_id:
-            logger.error(f"No hosted zone found for domain {base_domain}")
+            logger.error("No hosted zone found for domain %s", base_domain)
             return None
         
-        # Create A record
+        # Create all records in one request
         response = route53_client.change_resource_record_sets(
             HostedZoneId=zone_id,
             ChangeBatch={
-                'Changes': [{
-                    'Action': 'UPSERT',
-                    'ResourceRecordSet': {
-                        'Name': domain_name,
-                        'Type': 'A',
-                        'AliasTarget': {
-                            'HostedZoneId': 'Z2FDTNDATAQYW2',  # CloudFront's hosted zone ID (constant)
-                            'DNSName': cloudfront_domain_name,
-                            'EvaluateTargetHealth': False
-                        }
-                    }
-                }]
+                'Changes': changes
             }
         )
         
-        logger.info(f"Route53 record created/updated successfully")
+        record_names = [change['ResourceRecordSet']['Name'] for change in changes]
+        logger.info("Route53 records created/updated successfully: %s", record_names)
         return response
         
     except ClientError as e:
-        logger.error(f"Error creating Route53 record: {str(e)}")
+        logger.error("Error creating Route53 records: %s", e)
         return None
 
 def wait_for_eb_environment_ready(environment_name, timeout_seconds=300):
@@ -389,102 +869,115 @@ def wait_for_eb_environment_ready(environment_name, timeout_seconds=300):
     Returns:
         bool: True if environment is ready, False if timeout occurred
     """
-    logger.info(f"Waiting for environment {environment_name} to be ready...")
-    eb_client = boto3.client('elasticbeanstalk', region_name=AWS_REGION)
-    start_time = time.time()
+    logger.info("Waiting for environment %s to be ready...", environment_name)
+    eb_client = get_client('elasticbeanstalk')
+    delay_seconds = 15
     
-    while time.time() - start_time < timeout_seconds:
-        try:
-            response = eb_client.describe_environments(
-                EnvironmentNames=[environment_name],
-                IncludeDeleted=False
-            )
-            
-            if not response['Environments']:
-                logger.error(f"Environment {environment_name} not found")
-                return False
-                
-            status = response['Environments'][0]['Status']
-            health = response['Environments'][0]['Health']
-            
-            logger.info(f"Environment status: {status}, health: {health}")
-            
-            if status == 'Ready':
-                logger.info(f"Environment {environment_name} is ready")
-                return True
-                
-            time.sleep(10)  # Wait 10 seconds before checking again
-            
-        except ClientError as e:
-            logger.error(f"Error checking environment status: {str(e)}")
+    try:
+        # The waiter has no failure state for a missing or terminated environment,
+        # so check once up front rather than polling until the timeout
+        response = eb_client.describe_environments(
+            EnvironmentNames=[environment_name],
+            IncludeDeleted=False
+        )
+        
+        if not response['Environments']:
+            logger.error("Environment %s not found", environment_name)
             return False
             
-    logger.error(f"Timeout waiting for environment {environment_name} to be ready")
-    return False
+        status = response['Environments'][0]['Status']
+        health = response['Environments'][0]['Health']
+        
+        logger.info("Environment status: %s, health: %s", status, health)
+        
+        if status in ('Terminating', 'Terminated'):
+            logger.error("Environment %s is %s", environment_name, status.lower())
+            return False
+        
+        if status == 'Ready':
+            logger.info("Environment %s is ready", environment_name)
+            return True
+        
+        eb_client.get_waiter('environment_updated').wait(
+            EnvironmentNames=[environment_name],
+            IncludeDeleted=False,
+            WaiterConfig={
+                'Delay': delay_seconds,
+                'MaxAttempts': max(1, timeout_seconds // delay_seconds)
+            }
+        )
+        logger.info("Environment %s is ready", environment_name)
+        return True
+        
+    except ClientError as e:
+        logger.error("Error checking environment status: %s", e)
+        return False
+    except WaiterError as e:
+        logger.error("Error waiting for environment %s to be ready: %s", environment_name, e)
+        return False
+
+@functools.lru_cache(maxsize=8)
+def _https_option_settings(certificate_arn):
+    """
+    Gets the EB option settings for an HTTPS listener with HTTP to HTTPS redirect
+    
+    Args:
+        certificate_arn (str): ACM certificate ARN for the HTTPS listener
+        
+    Returns:
+        tuple: (Namespace, OptionName, Value) triples
+    """
+    return (
+        # HTTPS Listener
+        ('aws:elbv2:listener:443', 'Protocol', 'HTTPS'),
+        ('aws:elbv2:listener:443', 'SSLCertificateArns', certificate_arn),
+        ('aws:elbv2:listener:443', 'DefaultProcess', 'default'),
+        # HTTP Listener
+        ('aws:elbv2:listener:80', 'Protocol', 'HTTP'),
+        ('aws:elbv2:listener:80', 'DefaultProcess', 'default'),
+        # Define the redirect process
+        ('aws:elasticbeanstalk:environment:process:redirect', 'Port', '443'),
+        ('aws:elasticbeanstalk:environment:process:redirect', 'Protocol', 'HTTPS'),
+        # Define the redirect rule
+        ('aws:elbv2:listenerrule:redirect', 'PathPatterns', '/*'),
+        ('aws:elbv2:listenerrule:redirect', 'Priority', '1'),
+        ('aws:elbv2:listenerrule:redirect', 'Process', 'redirect')
+    )
 
 def configure_eb_https(environment_name, certificate_arn):
+    """
+    Configures the HTTPS listener of an Elastic Beanstalk environment
+    
+    Args:
+        environment_name (str): Name of the Elastic Beanstalk environment
+        certificate_arn (str): ARN of the ACM certificate for the listener
+        
+    Returns:
+        dict: update_environment response, or None if no update was needed or it failed
+    """
     try:
+        eb_client = get_client('elasticbeanstalk')
+        
         if not wait_for_eb_environment_ready(environment_name):
             logger.error("Environment not ready, aborting HTTPS configuration")
             return None
             
-        eb_client = boto3.client('elasticbeanstalk', region_name=AWS_REGION)
+        # Skip the update (and the multi-minute wait after it) if nothing would change
+        configuration = eb_client.describe_configuration_settings(
+            ApplicationName=EB_APP_NAME,
+            EnvironmentName=environment_name
+        )
+        current_settings = {
+            (setting['Namespace'], setting['OptionName'], setting.get('Value'))
+            for setting in configuration['ConfigurationSettings'][0]['OptionSettings']
+        }
+        if set(_https_option_settings(certificate_arn)) <= current_settings:
+            logger.info("HTTPS configuration already up to date for environment %s", environment_name)
+            return None
         
         option_settings = [
-            # HTTPS Listener
-            {
-                'Namespace': 'aws:elbv2:listener:443',
-                'OptionName': 'Protocol',
-                'Value': 'HTTPS'
-            },
-            {
-                'Namespace': 'aws:elbv2:listener:443',
-                'OptionName': 'SSLCertificateArns',
-                'Value': certificate_arn
-            },
-            {
-                'Namespace': 'aws:elbv2:listener:443',
-                'OptionName': 'DefaultProcess',
-                'Value': 'default'
-            },
-            # HTTP Listener
-            {
-                'Namespace': 'aws:elbv2:listener:80',
-                'OptionName': 'Protocol',
-                'Value': 'HTTP'
-            },
-            {
-                'Namespace': 'aws:elbv2:listener:80',
-                'OptionName': 'DefaultProcess',
-                'Value': 'default'
-            },
-            # Define the redirect process
-            {
-                'Namespace': 'aws:elasticbeanstalk:environment:process:redirect',
-                'OptionName': 'Port',
-                'Value': '443'
-            },
-            {
-                'Namespace': 'aws:elasticbeanstalk:environment:process:redirect',
-                'OptionName': 'Protocol',
-                'Value': 'HTTPS'
-            },
-            # Define the redirect rule
-            {
-                'Namespace': 'aws:elbv2:listenerrule:redirect',
-                'OptionName': 'PathPatterns',
-                'Value': '/*'
-            },
-            {
-                'Namespace': 'aws:elbv2:listenerrule:redirect',
-                'OptionName': 'Priority',
-                'Value': '1'
-            },
-            {
-                'Namespace': 'aws:elbv2:listenerrule:redirect',
-                'OptionName': 'Process',
-                'Value': 'redirect'
-            }
+            {'Namespace': namespace, 'OptionName': option_name, 'Value': value}
+            for namespace, option_name, value in _https_option_settings(certificate_arn)
         ]
         
         response = eb_client.update_environment(
@@ -502,95 +995,140 @@ def configure_eb_https(environment_name, certificate_arn):
         return response
         
     except ClientError as e:
-        logger.error(f"Error configuring HTTPS for Elastic Beanstalk: {str(e)}")
+        logger.error("Error configuring HTTPS for Elastic Beanstalk: %s", e)
         return None
 
-def create_backend_route53_record(domain_name):
+def get_eb_cname(environment_name):
     """
-    Creates Route53 A record pointing to Elastic Beanstalk environment
+    Gets the CNAME of an Elastic Beanstalk environment, looked up once per environment
     
     Args:
-        domain_name (str): Domain name for the record (e.g., ra-api.ironcliff.ai)
+        environment_name (str): Name of the Elastic Beanstalk environment
+        
+    Returns:
+        str: Environment CNAME if successful, None if failed
     """
+    if environment_name in _eb_cname_cache:
+        return _eb_cname_cache[environment_name]
+    
     try:
-        route53_client = boto3.client('route53')
-        eb_client = boto3.client('elasticbeanstalk', region_name=AWS_REGION)
+        eb_client = get_client('elasticbeanstalk')
         
-        # Get the EB environment CNAME
-        eb_env = eb_client.describe_environments(
-            EnvironmentNames=[EB_ENV_NAME],
+        environments = eb_client.describe_environments(
+            EnvironmentNames=[environment_name],
             IncludeDeleted=False
-        )['Environments'][0]
+        )['Environments']
         
-        eb_cname = eb_env['CNAME']
-        
-        # Get the hosted zone ID for the domain
-        hosted_zones = route53_client.list_hosted_zones()
-        zone_id = None
-        base_domain = '.'.join(domain_name.split('.')[-2:])  # Get base domain (e.g., ironcliff.ai)
-        
-        for zone in hosted_zones['HostedZones']:
-            if zone['Name'].rstrip('.') == base_domain:
-                zone_id = zone['Id']
-                break
-        
-        if not zone_id:
-            logger.error(f"No hosted zone found for domain {base_domain}")
+        if not environments:
+            logger.error("Environment %s not found", environment_name)
             return None
         
-        # Create A record
-        response = route53_client.change_resource_record_sets(
-            HostedZoneId=zone_id,
-            ChangeBatch={
-                'Changes': [{
-                    'Action': 'UPSERT',
-                    'ResourceRecordSet': {
-                        'Name': domain_name,
-                        'Type': 'CNAME',
-                        'TTL': 300,
-                        'ResourceRecords': [{'Value': eb_cname}]
-                    }
-                }]
-            }
-        )
-        
-        logger.info(f"Route53 record created/updated successfully for backend")
-        return response
+        _eb_cname_cache[environment_name] = environments[0]['CNAME']
+        return _eb_cname_cache[environment_name]
         
     except ClientError as e:
-        logger.error(f"Error creating Route53 record for backend: {str(e)}")
+        logger.error("Error getting Elastic Beanstalk CNAME: %s", e)
         return None
 
+def get_backend_route53_change(domain_name, eb_cname):
+    """
+    Builds the Route53 change for a CNAME record pointing to Elastic Beanstalk environment
+    
+    Args:
+        domain_name (str): Domain name for the record (e.g., ra-api.ironcliff.ai)
+        eb_cname (str): Elastic Beanstalk environment CNAME
+        
+    Returns:
+        dict: Route53 UPSERT change
+    """
+    return {
+        'Action': 'UPSERT',
+        'ResourceRecordSet': {
+            'Name': domain_name,
+            'Type': 'CNAME',
+            'TTL': 300,
+            'ResourceRecords': [{'Value': eb_cname}]
+        }
+    }
+
 def deploy_app():
     logger.info("Starting deployment process")
     
-    # Create S3 bucket
-    s3_result = create_s3_bucket(frontend_domain)
-    logger.info(f"S3 bucket creation result: {s3_result}")
-    
-    # Create certificate - pass the full domain names
-    cert_arn = create_acm_certificate(
-        frontend_domain,
-        backend_domain
-    )
-    logger.info(f"Certificate creation result: {cert_arn}")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # S3 bucket, certificate and backend CNAME lookup have no dependency on each other
+        s3_future = executor.submit(create_s3_bucket, frontend_domain)
+        
+        # Create certificate - pass the full domain names
+        cert_future = executor.submit(
+            create_acm_certificate,
+            frontend_domain,
+            backend_domain
+        )
+        
+        # Look up the backend record target while the rest runs
+        eb_cname_future = executor.submit(get_eb_cname, EB_ENV_NAME)
+        
+        cert_arn = cert_future.result()
+        logger.info("Certificate creation result: %s", cert_arn)
 
-    # pause for certificate to be ready
-    time.sleep(10)
+        # CloudFront and the EB listener need an issued certificate (S3 setup continues meanwhile)
+        if not cert_arn:
+            logger.error("No certificate available, aborting deployment before EB and CloudFront steps")
+            return
+        if not wait_for_acm_certificate_validated(cert_arn):
+            logger.error("Certificate %s is not issued, aborting deployment before EB and CloudFront steps", cert_arn)
+            return
 
-    # Create CloudFront distribution
-    cloudfront_distribution = create_cloudfront_distribution(
-        frontend_domain,
-        cert_arn
-    )
-    logger.info(f"CloudFront distribution creation result: {cloudfront_distribution}")
-    
-    # Create Route53 record for frontend
-    create_frontend_route53_record(frontend_domain, cloudfront_distribution['DomainName'])
+        # Configure HTTPS for Elastic Beanstalk - only needs the certificate
+        eb_https_future = executor.submit(configure_eb_https, EB_ENV_NAME, cert_arn)
+        
+        s3_result = s3_future.result()
+        logger.info("S3 bucket creation result: %s", s3_result)
 
-    # Configure HTTPS for Elastic Beanstalk
-    configure_eb_https(EB_ENV_NAME, cert_arn)
-    
-    # Create Route53 record for backend
-    create_backend_route53_record(backend_domain)
+        # Create CloudFront distribution
+        cloudfront_distribution = create_cloudfront_distribution(
+            frontend_domain,
+            cert_arn
+        )
+        logger.info("CloudFront distribution creation result: %s", cloudfront_distribution)
+        
+        # Create Route53 records for frontend and backend in one batch
+        route53_changes = []
+        cloudfront_deployed_future = None
+        if cloudfront_distribution:
+            # Distribution rollout takes minutes - wait on it alongside the remaining steps
+            cloudfront_deployed_future = executor.submit(
+                wait_for_cloudfront_distribution_deployed,
+                cloudfront_distribution['Id']
+            )
+            route53_changes.append(
+                get_frontend_route53_change(frontend_domain, cloudfront_distribution['DomainName'])
+            )
+        else:
+            logger.error("No CloudFront distribution, skipping frontend Route53 record")
+        
+        eb_cname = eb_cname_future.result()
+        if eb_cname:
+            route53_changes.append(get_backend_route53_change(backend_domain, eb_cname))
+        if route53_changes:
+            create_route53_records(route53_changes)
+
+        eb_https_future.result()
+        if cloudfront_deployed_future:
+            cloudfront_deployed_future.result()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deploy the SPA stack to AWS")
+    parser.add_argument(
+        '--eb-only',
+        metavar='CERT_ARN',
+        help="only configure HTTPS on the Elastic Beanstalk environment with this certificate"
+    )
+    args = parser.parse_args()
 
+    _configure_logging()
+    if args.eb_only:
+        configure_eb_https(EB_ENV_NAME, args.eb_only)
+    else:
+        deploy_app()